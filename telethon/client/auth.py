@@ -10,6 +10,26 @@ from ..tl import types, functions
 if typing.TYPE_CHECKING:
     from .telegramclient import TelegramClient
 
+# Bound once, since these are used on every login attempt
+_SignInRequest = functions.auth.SignInRequest
+_CheckPasswordRequest = functions.auth.CheckPasswordRequest
+_ImportBotAuthorizationRequest = functions.auth.ImportBotAuthorizationRequest
+_SignUpRequest = functions.auth.SignUpRequest
+_SendCodeRequest = functions.auth.SendCodeRequest
+_ResendCodeRequest = functions.auth.ResendCodeRequest
+_LogOutRequest = functions.auth.LogOutRequest
+_AcceptTermsOfServiceRequest = functions.help.AcceptTermsOfServiceRequest
+_GetPasswordRequest = functions.account.GetPasswordRequest
+_UpdatePasswordSettingsRequest = functions.account.UpdatePasswordSettingsRequest
+_ConfirmPasswordEmailRequest = functions.account.ConfirmPasswordEmailRequest
+_CodeSettings = types.CodeSettings
+_InputCheckPasswordEmpty = types.InputCheckPasswordEmpty
+_PasswordInputSettings = types.account.PasswordInputSettings
+
+# Error handlers with which printing to stdout never fails to encode
+_REPLACE_ERRORS = (
+    'replace', 'backslashreplace', 'xmlcharrefreplace', 'namereplace', 'ignore')
+
 
 class AuthMethods:
 
@@ -138,10 +158,14 @@ class AuthMethods:
         if not self.is_connected():
             await self.connect()
 
-        if await self.is_user_authorized():
+        if self._authorized or await self.is_user_authorized():
             return self
 
         if not bot_token:
+            if not callable(phone):
+                # Parse it only once, instead of on every attempt
+                phone = utils.parse_phone(phone) or phone
+
             # Turn the callable into a valid phone number (or bot token)
             while callable(phone):
                 value = phone()
@@ -156,7 +180,7 @@ class AuthMethods:
                 phone = utils.parse_phone(value) or phone
 
         if bot_token:
-            await self.sign_in(bot_token=bot_token)
+            await self._sign_in(bot_token=bot_token)
             return self
 
         me = None
@@ -178,10 +202,10 @@ class AuthMethods:
                     raise errors.PhoneCodeEmptyError(request=None)
 
                 if sign_up:
-                    me = await self.sign_up(value, first_name, last_name)
+                    me = await self._sign_up(value, first_name, last_name)
                 else:
                     # Raises SessionPasswordNeededError if 2FA enabled
-                    me = await self.sign_in(phone, code=value)
+                    me = await self._sign_in(phone, value)
                 break
             except errors.SessionPasswordNeededError:
                 two_step_detected = True
@@ -217,7 +241,7 @@ class AuthMethods:
                         if inspect.isawaitable(value):
                             value = await value
 
-                        me = await self.sign_in(phone=phone, password=value)
+                        me = await self._sign_in(phone=phone, password=value)
                         break
                     except errors.PasswordHashInvalidError:
                         print('Invalid password. Please try again',
@@ -225,16 +249,19 @@ class AuthMethods:
                 else:
                     raise errors.PasswordHashInvalidError(request=None)
             else:
-                me = await self.sign_in(phone=phone, password=password)
+                me = await self._sign_in(phone=phone, password=password)
 
         # We won't reach here if any step failed (exit by exception)
         signed, name = 'Signed in successfully as', utils.get_display_name(me)
-        try:
-            print(signed, name)
-        except UnicodeEncodeError:
-            # Some terminals don't support certain characters
-            print(signed, name.encode('utf-8', errors='ignore')
-                              .decode('ascii', errors='ignore'))
+
+        # Some terminals don't support certain characters. Unless the stream
+        # replaces them itself, drop the ones it can't encode (note that
+        # 'strict' or 'surrogateescape', common under a C locale, would raise)
+        if getattr(sys.stdout, 'errors', None) not in _REPLACE_ERRORS:
+            enc = getattr(sys.stdout, 'encoding', None) or 'utf-8'
+            name = name.encode(enc, errors='ignore').decode(enc, errors='ignore')
+
+        print(signed, name)
 
         return self
 
@@ -242,7 +269,9 @@ class AuthMethods:
         """
         Helper method to both parse and validate phone and its hash.
         """
-        phone = utils.parse_phone(phone) or self._phone
+        if phone != self._phone:
+            phone = utils.parse_phone(phone) or self._phone
+
         if not phone:
             raise ValueError(
                 'Please make sure to call send_code_request first.'
@@ -315,6 +344,16 @@ class AuthMethods:
         if me:
             return me
 
+        return await self._sign_in(
+            phone, code, password=password, bot_token=bot_token,
+            phone_code_hash=phone_code_hash)
+
+    async def _sign_in(
+            self: 'TelegramClient', phone=None, code=None, *,
+            password=None, bot_token=None, phone_code_hash=None):
+        """
+        Like `sign_in`, but assumes the user is not authorized yet.
+        """
         if phone and not code and not password:
             return await self.send_code_request(phone)
         elif code:
@@ -323,16 +362,16 @@ class AuthMethods:
 
             # May raise PhoneCodeEmptyError, PhoneCodeExpiredError,
             # PhoneCodeHashEmptyError or PhoneCodeInvalidError.
-            request = functions.auth.SignInRequest(
+            request = _SignInRequest(
                 phone, phone_code_hash, str(code)
             )
         elif password:
-            pwd = await self(functions.account.GetPasswordRequest())
-            request = functions.auth.CheckPasswordRequest(
+            pwd = await self(_GetPasswordRequest())
+            request = _CheckPasswordRequest(
                 pwd_mod.compute_check(pwd, password)
             )
         elif bot_token:
-            request = functions.auth.ImportBotAuthorizationRequest(
+            request = _ImportBotAuthorizationRequest(
                 flags=0, bot_auth_token=bot_token,
                 api_id=self.api_id, api_hash=self.api_hash
             )
@@ -404,6 +443,16 @@ class AuthMethods:
         if me:
             return me
 
+        return await self._sign_up(
+            code, first_name, last_name,
+            phone=phone, phone_code_hash=phone_code_hash)
+
+    async def _sign_up(
+            self: 'TelegramClient', code, first_name, last_name='', *,
+            phone=None, phone_code_hash=None):
+        """
+        Like `sign_up`, but assumes the user is not authorized yet.
+        """
         if self._tos and self._tos.text:
             if self.parse_mode:
                 t = self.parse_mode.unparse(self._tos.text, self._tos.entities)
@@ -415,7 +464,7 @@ class AuthMethods:
         phone, phone_code_hash = \
             self._parse_phone_and_hash(phone, phone_code_hash)
 
-        result = await self(functions.auth.SignUpRequest(
+        result = await self(_SignUpRequest(
             phone_number=phone,
             phone_code_hash=phone_code_hash,
             first_name=first_name,
@@ -423,8 +472,7 @@ class AuthMethods:
         ))
 
         if self._tos:
-            await self(
-                functions.help.AcceptTermsOfServiceRequest(self._tos.id))
+            await self(_AcceptTermsOfServiceRequest(self._tos.id))
 
         return self._on_login(result.user)
 
@@ -465,14 +513,14 @@ class AuthMethods:
                 sent = await client.send_code_request(phone)
                 print(sent)
         """
-        result = None
         phone = utils.parse_phone(phone) or self._phone
-        phone_hash = self._phone_code_hash.get(phone)
+        cache = self._phone_code_hash
+        phone_hash = cache.get(phone)
 
         if not phone_hash:
             try:
-                result = await self(functions.auth.SendCodeRequest(
-                    phone, self.api_id, self.api_hash, types.CodeSettings()))
+                result = await self(_SendCodeRequest(
+                    phone, self.api_id, self.api_hash, _CodeSettings()))
             except errors.AuthRestartError:
                 return await self.send_code_request(phone, force_sms=force_sms)
 
@@ -480,19 +528,20 @@ class AuthMethods:
             if isinstance(result.type, types.auth.SentCodeTypeSms):
                 force_sms = False
 
-            # phone_code_hash may be empty, if it is, do not save it (#1283)
-            if result.phone_code_hash:
-                self._phone_code_hash[phone] = phone_hash = result.phone_code_hash
+            phone_hash = result.phone_code_hash
         else:
             force_sms = True
 
         self._phone = phone
 
         if force_sms:
-            result = await self(
-                functions.auth.ResendCodeRequest(phone, phone_hash))
+            result = await self(_ResendCodeRequest(phone, phone_hash))
+
+            phone_hash = result.phone_code_hash
 
-            self._phone_code_hash[phone] = result.phone_code_hash
+        # phone_code_hash may be empty, if it is, do not save it (#1283)
+        if phone_hash:
+            cache[phone] = phone_hash
 
         return result
 
@@ -510,7 +559,7 @@ class AuthMethods:
                 await client.log_out()
         """
         try:
-            await self(functions.auth.LogOutRequest())
+            await self(_LogOutRequest())
         except errors.RPCError:
             return False
 
@@ -590,7 +639,7 @@ class AuthMethods:
         if email and not callable(email_code_callback):
             raise ValueError('email present without email_code_callback')
 
-        pwd = await self(functions.account.GetPasswordRequest())
+        pwd = await self(_GetPasswordRequest())
         pwd.new_algo.salt1 += os.urandom(32)
         assert isinstance(pwd, types.account.Password)
         if not pwd.has_password and current_password:
@@ -599,7 +648,7 @@ class AuthMethods:
         if current_password:
             password = pwd_mod.compute_check(pwd, current_password)
         else:
-            password = types.InputCheckPasswordEmpty()
+            password = _InputCheckPasswordEmpty()
 
         if new_password:
             new_password_hash = pwd_mod.compute_digest(
@@ -608,9 +657,9 @@ class AuthMethods:
             new_password_hash = b''
 
         try:
-            await self(functions.account.UpdatePasswordSettingsRequest(
+            await self(_UpdatePasswordSettingsRequest(
                 password=password,
-                new_settings=types.account.PasswordInputSettings(
+                new_settings=_PasswordInputSettings(
                     new_algo=pwd.new_algo,
                     new_password_hash=new_password_hash,
                     hint=hint,
@@ -624,7 +673,7 @@ class AuthMethods:
                 code = await code
 
             code = str(code)
-            await self(functions.account.ConfirmPasswordEmailRequest(code))
+            await self(_ConfirmPasswordEmailRequest(code))
 
         return True
 
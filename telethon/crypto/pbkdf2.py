@@ -0,0 +1,170 @@
+"""
+PBKDF2-HMAC-SHA512 implementation compiled with numba.
+
+This is only used when ``hashlib.pbkdf2_hmac`` is not available, which
+only happens since Python 3.12 when built without OpenSSL (older versions
+always provide it, with their own pure Python fallback). In that case it
+is faster than doing the same in pure Python. Importing this module fails
+if numba (or numpy) is missing.
+"""
+import hashlib
+
+import numpy as np
+from numba import njit
+
+
+_IV = np.array([
+    0x6a09e667f3bcc908, 0xbb67ae8584caa73b, 0x3c6ef372fe94f82b,
+    0xa54ff53a5f1d36f1, 0x510e527fade682d1, 0x9b05688c2b3e6c1f,
+    0x1f83d9abfb41bd6b, 0x5be0cd19137e2179
+], dtype=np.uint64)
+
+_K = np.array([
+    0x428a2f98d728ae22, 0x7137449123ef65cd, 0xb5c0fbcfec4d3b2f,
+    0xe9b5dba58189dbbc, 0x3956c25bf348b538, 0x59f111f1b605d019,
+    0x923f82a4af194f9b, 0xab1c5ed5da6d8118, 0xd807aa98a3030242,
+    0x12835b0145706fbe, 0x243185be4ee4b28c, 0x550c7dc3d5ffb4e2,
+    0x72be5d74f27b896f, 0x80deb1fe3b1696b1, 0x9bdc06a725c71235,
+    0xc19bf174cf692694, 0xe49b69c19ef14ad2, 0xefbe4786384f25e3,
+    0x0fc19dc68b8cd5b5, 0x240ca1cc77ac9c65, 0x2de92c6f592b0275,
+    0x4a7484aa6ea6e483, 0x5cb0a9dcbd41fbd4, 0x76f988da831153b5,
+    0x983e5152ee66dfab, 0xa831c66d2db43210, 0xb00327c898fb213f,
+    0xbf597fc7beef0ee4, 0xc6e00bf33da88fc2, 0xd5a79147930aa725,
+    0x06ca6351e003826f, 0x142929670a0e6e70, 0x27b70a8546d22ffc,
+    0x2e1b21385c26c926, 0x4d2c6dfc5ac42aed, 0x53380d139d95b3df,
+    0x650a73548baf63de, 0x766a0abb3c77b2a8, 0x81c2c92e47edaee6,
+    0x92722c851482353b, 0xa2bfe8a14cf10364, 0xa81a664bbc423001,
+    0xc24b8b70d0f89791, 0xc76c51a30654be30, 0xd192e819d6ef5218,
+    0xd69906245565a910, 0xf40e35855771202a, 0x106aa07032bbd1b8,
+    0x19a4c116b8d2d0c8, 0x1e376c085141ab53, 0x2748774cdf8eeb99,
+    0x34b0bcb5e19b48a8, 0x391c0cb3c5c95a63, 0x4ed8aa4ae3418acb,
+    0x5b9cca4f7763e373, 0x682e6ff3d6b2b8a3, 0x748f82ee5defb2fc,
+    0x78a5636f43172f60, 0x84c87814a1f0ab72, 0x8cc702081a6439ec,
+    0x90befffa23631e28, 0xa4506cebde82bde9, 0xbef9a3f7b2c67915,
+    0xc67178f2e372532b, 0xca273eceea26619c, 0xd186b8c721c0c207,
+    0xeada7dd6cde0eb1e, 0xf57d4f7fee6ed178, 0x06f067aa72176fba,
+    0x0a637dc5a2c898a6, 0x113f9804bef90dae, 0x1b710b35131c471b,
+    0x28db77f523047d84, 0x32caab7b40c72493, 0x3c9ebe0a15c9bebc,
+    0x431d67c49c100d4c, 0x4cc5d4becb3e42b6, 0x597f299cfc657e2a,
+    0x5fcb6fab3ad6faec, 0x6c44198c4a475817
+], dtype=np.uint64)
+
+
+@njit(cache=True)
+def _rotr(x, n):
+    return (x >> np.uint64(n)) | (x << np.uint64(64 - n))
+
+
+@njit(cache=True)
+def _compress(state, block):
+    """Runs the SHA-512 compression function over a 128-byte block."""
+    w = np.empty(80, dtype=np.uint64)
+    for t in range(16):
+        v = np.uint64(0)
+        for j in range(8):
+            v = (v << np.uint64(8)) | np.uint64(block[t * 8 + j])
+        w[t] = v
+
+    for t in range(16, 80):
+        s0 = _rotr(w[t - 15], 1) ^ _rotr(w[t - 15], 8) ^ (w[t - 15] >> np.uint64(7))
+        s1 = _rotr(w[t - 2], 19) ^ _rotr(w[t - 2], 61) ^ (w[t - 2] >> np.uint64(6))
+        w[t] = w[t - 16] + s0 + w[t - 7] + s1
+
+    a, b, c, d, e, f, g, h = (state[0], state[1], state[2], state[3],
+                              state[4], state[5], state[6], state[7])
+    for t in range(80):
+        s1 = _rotr(e, 14) ^ _rotr(e, 18) ^ _rotr(e, 41)
+        t1 = h + s1 + ((e & f) ^ (~e & g)) + _K[t] + w[t]
+        s0 = _rotr(a, 28) ^ _rotr(a, 34) ^ _rotr(a, 39)
+        t2 = s0 + ((a & b) ^ (a & c) ^ (b & c))
+        h = g
+        g = f
+        f = e
+        e = d + t1
+        d = c
+        c = b
+        b = a
+        a = t1 + t2
+
+    state[0] += a
+    state[1] += b
+    state[2] += c
+    state[3] += d
+    state[4] += e
+    state[5] += f
+    state[6] += g
+    state[7] += h
+
+
+@njit(cache=True)
+def _store(state, out):
+    """Writes the big-endian digest of the state into the first 64 bytes."""
+    for i in range(8):
+        v = state[i]
+        for j in range(7, -1, -1):
+            out[i * 8 + j] = np.uint8(v & np.uint64(0xff))
+            v >>= np.uint64(8)
+
+
+@njit(cache=True)
+def _pad(data, offset):
+    """Returns the padded SHA-512 blocks for data after offset bytes."""
+    n = len(data)
+    size = ((n + 17 + 127) // 128) * 128
+    blocks = np.zeros(size, dtype=np.uint8)
+    blocks[:n] = data
+    blocks[n] = 0x80
+    # The length is 128 bits but messages here never need the upper half
+    length = np.uint64((offset + n) * 8)
+    for j in range(8):
+        blocks[size - 1 - j] = np.uint8(length & np.uint64(0xff))
+        length >>= np.uint64(8)
+    return blocks
+
+
+@njit(cache=True)
+def _pbkdf2(key, salt, iterations):
+    inner = _IV.copy()
+    _compress(inner, key ^ np.uint8(0x36))
+    outer = _IV.copy()
+    _compress(outer, key ^ np.uint8(0x5c))
+
+    # The first round hashes salt + INT(1), the rest a previous digest.
+    # Digests always fit in one block, so their padding is prepared once.
+    message = np.zeros(len(salt) + 4, dtype=np.uint8)
+    message[:len(salt)] = salt
+    message[-1] = 1
+
+    iblock = _pad(np.zeros(64, dtype=np.uint8), 128)
+    oblock = _pad(np.zeros(64, dtype=np.uint8), 128)
+
+    state = inner.copy()
+    blocks = _pad(message, 128)
+    for i in range(0, len(blocks), 128):
+        _compress(state, blocks[i:i + 128])
+
+    _store(state, oblock)
+    state = outer.copy()
+    _compress(state, oblock)
+    _store(state, iblock)
+    result = iblock[:64].copy()
+
+    for _ in range(1, iterations):
+        state = inner.copy()
+        _compress(state, iblock)
+        _store(state, oblock)
+        state = outer.copy()
+        _compress(state, oblock)
+        _store(state, iblock)
+        result ^= iblock[:64]
+
+    return result
+
+
+def pbkdf2sha512(password: bytes, salt: bytes, iterations: int) -> bytes:
+    if len(password) > 128:
+        password = hashlib.sha512(password).digest()
+
+    key = np.frombuffer(password.ljust(128, b'\0'), dtype=np.uint8).copy()
+    salt = np.frombuffer(salt, dtype=np.uint8).copy()
+    return _pbkdf2(key, salt, iterations).tobytes()
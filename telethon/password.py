@@ -1,9 +1,35 @@
 import hashlib
+import logging
 import os
 
 from .crypto import factorization
 from .tl import types
 
+__log__ = logging.getLogger(__name__)
+
+try:
+    from fastpbkdf2 import pbkdf2_hmac as _pbkdf2_hmac
+    __log__.info('fastpbkdf2 detected, it will be used for password hashing')
+except ImportError:
+    _pbkdf2_hmac = getattr(hashlib, 'pbkdf2_hmac', None)
+
+# Only Python 3.12+ built without OpenSSL lacks hashlib.pbkdf2_hmac
+_pbkdf2sha512_numba = None
+if not _pbkdf2_hmac:
+    try:
+        from .crypto.pbkdf2 import pbkdf2sha512 as _pbkdf2sha512_numba
+        __log__.info('hashlib.pbkdf2_hmac not found, '
+                     'numba will be used for password hashing')
+    except ImportError:
+        __log__.info('hashlib.pbkdf2_hmac not found and numba not installed, '
+                     'falling back to (slower) Python password hashing')
+
+try:
+    import gmpy2
+    __log__.info('gmpy2 detected, it will be used for modular exponentiation')
+except ImportError:
+    gmpy2 = None
+
 
 def check_prime_and_good_check(prime: int, g: int):
     good_prime_bits_count = 2048
@@ -90,6 +116,12 @@ def sha256(*p: bytes) -> bytes:
     return hash.digest()
 
 
+def mod_exp(base: int, exp: int, mod: int) -> int:
+    if gmpy2:
+        return int(gmpy2.powmod(base, exp, mod))
+    return pow(base, exp, mod)
+
+
 def is_good_mod_exp_first(modexp, prime) -> bool:
     diff = prime - modexp
     min_diff_bits_count = 2048 - 64
@@ -106,8 +138,45 @@ def xor(a: bytes, b: bytes) -> bytes:
     return bytes(x ^ y for x, y in zip(a, b))
 
 
+# HMAC-SHA512 pads as integers, to XOR the whole key block at once
+_IPAD = int.from_bytes(b'\x36' * 128, 'big')
+_OPAD = int.from_bytes(b'\x5c' * 128, 'big')
+
+
+def _pbkdf2sha512_python(password: bytes, salt: bytes, iterations: int):
+    # HMAC-SHA512 processes the padded key as a full block on every call.
+    # Hash the inner and outer padded keys once, and only copy those states
+    # on every round, which halves the amount of compressions per iteration.
+    if len(password) > 128:
+        password = hashlib.sha512(password).digest()
+
+    key = int.from_bytes(password.ljust(128, b'\0'), 'big')
+    inner = hashlib.sha512((key ^ _IPAD).to_bytes(128, 'big'))
+    outer = hashlib.sha512((key ^ _OPAD).to_bytes(128, 'big'))
+
+    # The derived key is as long as the digest, so there is only one block
+    prev = salt + b'\0\0\0\1'
+    result = 0
+    for _ in range(iterations):
+        ictx = inner.copy()
+        ictx.update(prev)
+        octx = outer.copy()
+        octx.update(ictx.digest())
+        prev = octx.digest()
+        result ^= int.from_bytes(prev, 'big')
+
+    return result.to_bytes(64, 'big')
+
+
 def pbkdf2sha512(password: bytes, salt: bytes, iterations: int):
-    return hashlib.pbkdf2_hmac('sha512', password, salt, iterations)
+    # Either fastpbkdf2 or hashlib's implementation. hashlib.pbkdf2_hmac
+    # always exists up to Python 3.11 (with its own pure Python fallback),
+    # but since Python 3.12 it is missing if Python was built without OpenSSL
+    if _pbkdf2_hmac:
+        return _pbkdf2_hmac('sha512', password, salt, iterations)
+    if _pbkdf2sha512_numba:
+        return _pbkdf2sha512_numba(password, salt, iterations)
+    return _pbkdf2sha512_python(password, salt, iterations)
 
 
 def compute_hash(algo: types.PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow,
@@ -125,9 +194,9 @@ def compute_digest(algo: types.PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter10
     except ValueError:
         raise ValueError('bad p/g in password')
 
-    value = pow(algo.g,
-                int.from_bytes(compute_hash(algo, password), 'big'),
-                int.from_bytes(algo.p, 'big'))
+    value = mod_exp(algo.g,
+                    int.from_bytes(compute_hash(algo, password), 'big'),
+                    int.from_bytes(algo.p, 'big'))
 
     return big_num_for_hash(value)
 
@@ -156,7 +225,7 @@ def compute_check(request: types.account.Password, password: str):
     p_for_hash = num_bytes_for_hash(algo.p)
     g_for_hash = big_num_for_hash(g)
     b_for_hash = num_bytes_for_hash(request.srp_B)
-    g_x = pow(g, x, p)
+    g_x = mod_exp(g, x, p)
     k = int.from_bytes(sha256(p_for_hash, g_for_hash), 'big')
     kg_x = (k * g_x) % p
 
@@ -166,7 +235,7 @@ def compute_check(request: types.account.Password, password: str):
         while True:
             random = os.urandom(random_size)
             a = int.from_bytes(random, 'big')
-            A = pow(g, a, p)
+            A = mod_exp(g, a, p)
             if is_good_mod_exp_first(A, p):
                 a_for_hash = big_num_for_hash(A)
                 u = int.from_bytes(sha256(a_for_hash, b_for_hash), 'big')
@@ -180,7 +249,7 @@ def compute_check(request: types.account.Password, password: str):
 
     ux = u * x
     a_ux = a + ux
-    S = pow(g_b, a_ux, p)
+    S = mod_exp(g_b, a_ux, p)
     K = sha256(big_num_for_hash(S))
     M1 = sha256(
         xor(sha256(p_for_hash), sha256(g_for_hash)),
@@ -0,0 +1,15 @@
+"""
+Tests for `telethon.crypto.pbkdf2`.
+"""
+import hashlib
+
+import pytest
+
+pbkdf2 = pytest.importorskip('telethon.crypto.pbkdf2')
+
+
+@pytest.mark.parametrize('password', [b'', b'hunter2', bytes(range(128)), bytes(200)])
+@pytest.mark.parametrize('salt', [b'', b'\x01' * 40, b'\x02' * 124])
+def test_pbkdf2sha512(password, salt):
+    assert pbkdf2.pbkdf2sha512(password, salt, 1000) == \
+        hashlib.pbkdf2_hmac('sha512', password, salt, 1000)
@@ -0,0 +1,15 @@
+"""
+tests for telethon.password
+"""
+import hashlib
+
+import pytest
+
+from telethon import password as pwd_mod
+
+
+@pytest.mark.parametrize('password', [b'', b'hunter2', bytes(range(128)), bytes(200)])
+def test_pbkdf2sha512_python(password):
+    salt = b'\x01' * 40
+    assert pwd_mod._pbkdf2sha512_python(password, salt, 1000) == \
+        hashlib.pbkdf2_hmac('sha512', password, salt, 1000)